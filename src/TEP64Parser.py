@@ -1,6 +1,50 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from hashlib import sha256
 from pytoniq_core import Cell
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as _json_loads
+
+# Standard TEP-64 metadata labels and their default values
+_DEFAULT_VALUES = {
+    "uri": None,
+    "name": None,
+    "description": None,
+    "image": None,
+    "image_data": None,
+    "symbol": None,
+    "decimals": "9",
+    "amount_style": "n",
+    "render_type": "currency",
+}
+
+_IPFS_SCHEME = "ipfs://"
+
+# Pristine SHA-256 state; copying it skips re-running the hash initialisation.
+# hashlib uses OpenSSL when available, which dispatches to SHA-NI/ARMv8 SHA2.
+_SHA256_TEMPLATE = sha256()
+
+
+def _sha256_key(key_string):
+    """
+    Calculate a key using SHA-256 from a given string.
+
+    Args:
+        key_string (str): The string to calculate the key from.
+
+    Returns:
+        int: The calculated key as a 256-bit integer.
+    """
+    h = _SHA256_TEMPLATE.copy()
+    h.update(key_string.encode("utf-8"))
+    return int.from_bytes(h.digest(), "big")
 
 
 class ContentParsingError(Exception):
@@ -27,16 +71,35 @@ class TEP64Parser:
 
     Attributes:
         ipfs_endpoint (str): The base URL for fetching IPFS data.
-        prefix_handlers (dict): Custom handlers for specific prefix values.
-        extra_default_values (dict): Additional default values for onchain content.
-        default_handlers (dict): Default handlers for predefined prefixes.
+        timeout (float or tuple): Timeout in seconds for each HTTP request.
+        prefix_handlers (Mapping): Read-only view of the custom handlers for specific prefix values.
+        extra_default_values (Mapping): Read-only view of the additional default values for onchain content.
+        default_handlers (Mapping): Read-only default handlers for predefined prefixes.
     """
 
+    __slots__ = (
+        "ipfs_endpoint",
+        "timeout",
+        "prefix_handlers",
+        "_prefix_handlers",
+        "extra_default_values",
+        "default_handlers",
+        "_handlers",
+        "_default_values_template",
+        "_metadata_keys",
+        "_key_to_label",
+        "_session",
+        "_cached_fetch",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         ipfs_endpoint="https://ipfs.io/ipfs/",
         prefix_handlers=None,
         extra_default_values=None,
+        cache_size=0,
+        timeout=30,
     ):
         """
         Initialize TEP64Parser with optional parameters.
@@ -45,52 +108,191 @@ class TEP64Parser:
             ipfs_endpoint (str, optional): The base URL for IPFS data fetching. Defaults to "https://ipfs.io/ipfs/".
             prefix_handlers (dict, optional): Custom handlers for specific prefix values. Defaults to None.
             extra_default_values (dict, optional): Additional default values for onchain content. Defaults to None.
+            cache_size (int, optional): Maximum number of fetched URIs kept in the LRU cache; 0 disables caching. Entries hold whole response bodies with no size limit or expiry, so memory grows with cache_size times the largest payload. Defaults to 0.
+            timeout (float or tuple, optional): Timeout in seconds for each HTTP request, or a (connect, read) tuple as accepted by requests. Defaults to 30.
         """
         self.ipfs_endpoint = ipfs_endpoint
-        self.prefix_handlers = prefix_handlers or {}
-        self.extra_default_values = extra_default_values or {}
-        self.default_handlers = {
-            0x01: self.default_handle_offchain_content,
-            0x00: self.default_handle_onchain_content,
+        self.timeout = timeout
+        # Own copy exposed read-only, so the caller's dict is never mutated and
+        # direct edits fail instead of being ignored; use register_handler
+        self._prefix_handlers = dict(prefix_handlers or {})
+        self.prefix_handlers = MappingProxyType(self._prefix_handlers)
+        # Read-only copy: the defaults template and label keys below are built
+        # from it once, so later edits would be silently ignored
+        self.extra_default_values = MappingProxyType(dict(extra_default_values or {}))
+        # Read-only: handlers are dispatched from the prebuilt table below, so
+        # changes here would be silently ignored; use register_handler instead
+        self.default_handlers = MappingProxyType(
+            {
+                0x01: self.default_handle_offchain_content,
+                0x00: self.default_handle_onchain_content,
+            }
+        )
+        # Custom handlers take precedence over default handlers
+        self._handlers = {**self.default_handlers, **self._prefix_handlers}
+
+        self._default_values_template = {**_DEFAULT_VALUES, **self.extra_default_values}
+
+        # Only labels outside the standard set need hashing per instance
+        self._metadata_keys = {
+            **_STANDARD_KEYS,
+            **self._batch_calculate_keys(
+                label
+                for label in self.extra_default_values
+                if label not in _STANDARD_KEYS
+            ),
         }
+        self._key_to_label = {key: label for label, key in self._metadata_keys.items()}
+
+        # Pooled session so repeated fetches reuse TCP/TLS connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Fetched data is immutable bytes, so results can be shared across calls
+        self._cached_fetch = lru_cache(maxsize=cache_size)(self._fetch_uri)
+
+    def __reduce__(self):
+        # The fetch cache, session and read-only views can't be pickled, so
+        # rebuild the parser from its constructor arguments; cache is not kept
+        return (
+            type(self),
+            (
+                self.ipfs_endpoint,
+                dict(self._prefix_handlers),
+                dict(self.extra_default_values),
+                self._cached_fetch.cache_info().maxsize,
+                self.timeout,
+            ),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self._session.close()
+
+    def clear_cache(self):
+        """
+        Drop all cached fetch results.
+        """
+        self._cached_fetch.cache_clear()
+
+    def register_handler(self, prefix, handler):
+        """
+        Register a handler for a specific prefix value.
+
+        Args:
+            prefix (int): The prefix value to handle.
+            handler (callable): The handler called with the Cell slice for this prefix.
+        """
+        self._prefix_handlers[prefix] = handler
+        self._handlers[prefix] = handler
 
     def fetch_data(self, uri):
         """
-        Fetch data from a given URI.
+        Fetch raw data from a given URI.
+
+        If the parser was created with a cache_size, results are cached by URI
+        so repeated fetches of the same URI only hit the network once. Failed
+        fetches are not cached.
+
+        Args:
+            uri (str): The URI to fetch data from.
+
+        Returns:
+            bytes: The fetched data.
+
+        Raises:
+            DataFetchingError: If there's an error fetching the data.
+        """
+        return self._cached_fetch(uri)
+
+    def _fetch_uri(self, uri):
+        """
+        Fetch raw data from a given URI, bypassing the cache.
+
+        The body is returned as raw bytes, skipping the decode to str that
+        response.text would do.
 
         Args:
             uri (str): The URI to fetch data from.
 
         Returns:
-            str: The fetched data.
+            bytes: The fetched data.
 
         Raises:
             DataFetchingError: If there's an error fetching the data.
         """
+        if uri.startswith(_IPFS_SCHEME):
+            uri = self.ipfs_endpoint + uri[len(_IPFS_SCHEME) :]
         try:
-            if uri.startswith("ipfs://"):
-                ipfs_uri = uri.replace("ipfs://", self.ipfs_endpoint)
-                response = requests.get(ipfs_uri)
-            else:
-                response = requests.get(uri)
+            response = self._session.get(uri, timeout=self.timeout)
             response.raise_for_status()
-            return response.text
+            return response.content
         except requests.RequestException as e:
             raise DataFetchingError(f"Error fetching data: {e}")
 
+    def fetch_json(self, uri):
+        """
+        Fetch and decode JSON data from a given URI.
+
+        Uses orjson when it is installed, falling back to the stdlib json module.
+
+        Args:
+            uri (str): The URI to fetch data from.
+
+        Returns:
+            Any: The decoded JSON document.
+
+        Raises:
+            DataFetchingError: If there's an error fetching or decoding the data.
+        """
+        data = self.fetch_data(uri)
+        try:
+            return _json_loads(data)
+        except ValueError as e:
+            raise DataFetchingError(f"Error decoding JSON data: {e}")
+
+    @staticmethod
+    def decode_data(data, encoding="utf-8"):
+        """
+        Decode fetched offchain data to text.
+
+        Args:
+            data (bytes): The data returned by fetch_data.
+            encoding (str, optional): The text encoding. Defaults to "utf-8".
+
+        Returns:
+            str: The decoded data.
+        """
+        return data.decode(encoding)
+
     @staticmethod
     def parse_prefix(cs):
         """
-        Parse the prefix value from a Cell.
+        Parse the 8-bit prefix value from a Cell.
 
         Args:
             cs (Cell): The Cell object containing the data to parse.
 
         Returns:
-            int: The parsed prefix value as an integer.
+            int: The parsed prefix value as an unsigned integer (0-255).
         """
-        prefix = cs.load_bits(8)
-        return int(prefix.to01())
+        return cs.load_uint(8)
 
     def default_handle_offchain_content(self, cs):
         """
@@ -106,20 +308,46 @@ class TEP64Parser:
             InvalidPrefixError: If the prefix value is invalid for offchain content.
             DataFetchingError: If there's an error fetching the data.
         """
-        uri = None
+        return self._load_offchain(self._extract_offchain_uri(cs))
+
+    def _load_offchain(self, uri, fetch=True):
+        """
+        Build offchain content data for an extracted URI.
+
+        Args:
+            uri (str): The offchain content URI.
+            fetch (bool, optional): Whether to fetch the data; if False, "data" is None. Defaults to True.
+
+        Returns:
+            dict: Parsed offchain content data.
+
+        Raises:
+            DataFetchingError: If there's an error fetching the data.
+        """
+        data = self.fetch_data(uri) if fetch else None
+        return {"type": "offchain", "uri": uri, "data": data}
+
+    def _extract_offchain_uri(self, cs):
+        """
+        Extract the URI from offchain content without fetching it.
+
+        Args:
+            cs (Cell): The Cell object containing the offchain content.
+
+        Returns:
+            str: The offchain content URI.
 
+        Raises:
+            InvalidPrefixError: If the prefix value is invalid for offchain content.
+        """
         if cs.refs == 0:
             prefix_value = self.parse_prefix(cs)
             if prefix_value != 0x00:
                 raise InvalidPrefixError(
                     f"Invalid prefix for offchain content: {prefix_value}"
                 )
-            uri = cs.load_string(cs.bits)
-        else:
-            uri = cs.load_snake_string()
-
-        data = self.fetch_data(uri)
-        return {"type": "offchain", "uri": uri, "data": data}
+            return cs.load_string(cs.bits)
+        return cs.load_snake_string()
 
     @staticmethod
     def load_metadata(cs):
@@ -130,7 +358,7 @@ class TEP64Parser:
             cs (Cell): The Cell object containing the metadata.
 
         Returns:
-            dict: Loaded metadata as a dictionary.
+            dict: Loaded metadata keyed by 256-bit integer keys, or None if empty.
         """
         return cs.load_dict(256)
 
@@ -143,10 +371,49 @@ class TEP64Parser:
             key_string (str): The string to calculate the key from.
 
         Returns:
-            int: The calculated key as an integer.
+            int: The calculated key as an integer, matching the key type of
+            the dictionaries returned by load_metadata.
         """
-        key_bytes = sha256(key_string.encode("utf-8")).digest()
-        return int.from_bytes(key_bytes, "big")
+        return _sha256_key(key_string)
+
+    @staticmethod
+    def _batch_calculate_keys(labels):
+        """
+        Calculate SHA-256 keys for several labels in a single pass.
+
+        Args:
+            labels (iterable): The label strings to calculate keys for.
+
+        Returns:
+            dict: Mapping of each label to its calculated key.
+        """
+        return {label: _sha256_key(label) for label in labels}
+
+    @staticmethod
+    def _load_snake_bytes(cs, buf):
+        """
+        Append the bytes of snake-encoded data to a buffer.
+
+        Walks the chain of refs iteratively, so the value is decoded once by
+        the caller instead of concatenating bytes per cell.
+
+        Args:
+            cs (Cell): The Cell object containing the snake-encoded data.
+            buf (bytearray): The buffer to append the data to.
+        """
+        while True:
+            if cs.remaining_bits % 8:
+                raise ContentParsingError(
+                    f"Invalid snake data length: {cs.remaining_bits}"
+                )
+            buf += cs.load_bytes(cs.remaining_bits // 8)
+            if not cs.remaining_refs:
+                return
+            if cs.remaining_refs != 1:
+                raise ContentParsingError(
+                    f"Invalid amount of refs in snake data: {cs.remaining_refs}"
+                )
+            cs = cs.load_ref().begin_parse()
 
     def default_handle_onchain_content(self, cs):
         """
@@ -159,38 +426,54 @@ class TEP64Parser:
             dict: Parsed onchain content metadata.
 
         """
-        default_values = {
-            "uri": None,
-            "name": None,
-            "description": None,
-            "image": None,
-            "image_data": None,
-            "symbol": None,
-            "decimals": "9",
-            "amount_style": "n",
-            "render_type": "currency",
-        }
+        metadata = self.load_metadata(cs)
+        all_metadata = self._default_values_template.copy()
+
+        # On-chain dicts are usually sparse, so walk their entries and skip
+        # keys that don't map to a known label
+        key_to_label = self._key_to_label
+        buf = bytearray()
+        for key, value_chunk in (metadata or {}).items():
+            label = key_to_label.get(key)
+            if label is not None:
+                buf.clear()
+                self._load_snake_bytes(value_chunk, buf)
+                all_metadata[label] = buf.decode("utf-8")
 
-        default_values.update(self.extra_default_values)
+        return {"type": "onchain", "metadata": all_metadata}
 
-        metadata_keys = {label: self.calculate_key(label) for label in default_values}
-        metadata = self.load_metadata(cs)
-        all_metadata = default_values.copy()
+    def _dispatch(self, content, fetch):
+        """
+        Parse content with the handler registered for its prefix value.
 
-        for label, key in metadata_keys.items():
-            value_chunk = metadata.get(key)
-            if value_chunk is not None:
-                value = value_chunk.load_snake_string()
-                all_metadata[label] = value
+        Args:
+            content (Cell): The Cell object containing the content to parse.
+            fetch (bool): Whether to fetch offchain data.
 
-        return {"type": "onchain", "metadata": all_metadata}
+        Returns:
+            tuple: (True, result) with the handler's result, or (False, prefix)
+            if no handler is registered for the prefix value.
+        """
+        cs = content.begin_parse()
+        prefix_value = self.parse_prefix(cs)
+
+        # Fetch the appropriate handler for the given prefix
+        handler = self._handlers.get(prefix_value)
+
+        if not handler:
+            return False, prefix_value
+        if not fetch and handler == self.default_handle_offchain_content:
+            uri = self._extract_offchain_uri(cs)
+            return True, self._load_offchain(uri, fetch=False)
+        return True, handler(cs)
 
-    def parse_content(self, content: Cell):
+    def parse_content(self, content: Cell, fetch=True):
         """
         Parse content based on the prefix value.
 
         Args:
             content (Cell): The Cell object containing the content to parse.
+            fetch (bool, optional): Whether to fetch offchain data; if False, offchain results only carry the URI and "data" is None. Defaults to True.
 
         Returns:
             dict: Parsed content data.
@@ -198,19 +481,168 @@ class TEP64Parser:
         Raises:
             InvalidPrefixError: If the prefix value is invalid.
         """
-        cs = content.begin_parse()
-        prefix_value = self.parse_prefix(cs)
+        ok, result = self._dispatch(content, fetch)
+        if not ok:
+            raise InvalidPrefixError(f"Invalid prefix: {result}")
+        return result
 
-        # Merge custom handlers with default handlers, with custom handlers taking precedence
-        handlers = {**self.default_handlers, **self.prefix_handlers}
+    def parse_content_safe(self, content: Cell, fetch=True):
+        """
+        Parse content based on the prefix value, without raising on an unknown prefix.
 
-        # Fetch the appropriate handler for the given prefix
-        handler = handlers.get(prefix_value)
+        Args:
+            content (Cell): The Cell object containing the content to parse.
+            fetch (bool, optional): Whether to fetch offchain data. Defaults to True.
+
+        Returns:
+            dict: Parsed content data, or {"type": "invalid", "prefix": prefix}
+            if no handler is registered for the prefix value.
+        """
+        ok, result = self._dispatch(content, fetch)
+        if not ok:
+            return {"type": "invalid", "prefix": result}
+        return result
+
+    def _parse_batch(self, contents, max_workers, fetch, store, store_data):
+        """
+        Parse several contents, then fetch their offchain data concurrently.
+
+        Args:
+            contents (list): The Cell objects containing the contents to parse.
+            max_workers (int): Maximum number of concurrent fetches.
+            fetch (bool): Whether to fetch offchain data.
+            store (callable): Called as store(index, result) for each parsed content.
+            store_data (callable): Called as store_data(index, data, error) once the offchain data of a content has been fetched; error is None on success, otherwise data is None and error describes the failure.
+        """
+        pending = {}  # uri -> indexes of results waiting for its data
+
+        # Dispatch is inlined with lookups resolved once, rather than per cell
+        # on the hot loop; it mirrors _dispatch with offchain fetches deferred
+        get_handler = self._handlers.get
+        parse_prefix = self.parse_prefix
+        offchain_handler = self.default_handle_offchain_content
+        extract_uri = self._extract_offchain_uri
+        load_offchain = self._load_offchain
+
+        for index, content in enumerate(contents):
+            cs = content.begin_parse()
+            prefix_value = parse_prefix(cs)
+            handler = get_handler(prefix_value)
+
+            if not handler:
+                store(index, {"type": "invalid", "prefix": prefix_value})
+            elif handler == offchain_handler:
+                uri = extract_uri(cs)
+                if fetch:
+                    pending.setdefault(uri, []).append(index)
+                store(index, load_offchain(uri, fetch=False))
+            else:
+                store(index, handler(cs))
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.fetch_data, uri): indexes
+                    for uri, indexes in pending.items()
+                }
+                # A failed fetch is reported on its own contents instead of
+                # discarding the rest of the batch
+                for future, indexes in futures.items():
+                    try:
+                        data, error = future.result(), None
+                    except DataFetchingError as e:
+                        data, error = None, str(e)
+                    for index in indexes:
+                        store_data(index, data, error)
+
+    def parse_contents(self, contents, max_workers=16, fetch=True):
+        """
+        Parse several contents, fetching offchain data concurrently.
+
+        URIs of offchain contents are extracted first, then all distinct URIs
+        are fetched in parallel so network round trips overlap. Failures don't
+        abort the batch: contents with an unknown prefix are reported as
+        {"type": "invalid", "prefix": prefix} like in parse_content_safe, and
+        offchain contents whose fetch failed get "data" None plus an "error"
+        message.
+
+        Args:
+            contents (iterable): The Cell objects containing the contents to parse.
+            max_workers (int, optional): Maximum number of concurrent fetches. Defaults to 16.
+            fetch (bool, optional): Whether to fetch offchain data. Defaults to True.
+
+        Returns:
+            list: Parsed content data, in the same order as the input.
+        """
+        contents = list(contents)
+        results = [None] * len(contents)
+
+        def store_data(index, data, error):
+            result = results[index]
+            result["data"] = data
+            if error is not None:
+                result["error"] = error
+
+        self._parse_batch(contents, max_workers, fetch, results.__setitem__, store_data)
+        return results
+
+    def parse_contents_columnar(self, contents, max_workers=16, fetch=True):
+        """
+        Parse several contents into column-oriented results.
+
+        Each field becomes one list holding the value for every content, so
+        the result can be passed directly to pandas.DataFrame or pyarrow.table.
+        Columns are filled as each content is parsed, without keeping a dict per
+        content. Onchain metadata labels get their own "metadata.<label>"
+        columns, separate from the top-level "type", "uri" and "data" fields;
+        fields a content doesn't provide are None. Failures are reported per
+        content as in parse_contents, with fetch errors in an "error" column.
+
+        Args:
+            contents (iterable): The Cell objects containing the contents to parse.
+            max_workers (int, optional): Maximum number of concurrent fetches. Defaults to 16.
+            fetch (bool, optional): Whether to fetch offchain data. Defaults to True.
+
+        Returns:
+            dict: Mapping of field names to lists of values, in input order.
+        """
+        contents = list(contents)
+        size = len(contents)
+        columns = {
+            name: [None] * size
+            for name in (
+                "type",
+                "uri",
+                "data",
+                *(f"metadata.{label}" for label in self._default_values_template),
+            )
+        }
+
+        def column(name):
+            values = columns.get(name)
+            if values is None:
+                values = columns[name] = [None] * size
+            return values
+
+        def store(index, result):
+            for name, value in result.items():
+                if name == "metadata":
+                    for label, label_value in value.items():
+                        column(f"metadata.{label}")[index] = label_value
+                else:
+                    column(name)[index] = value
 
-        if handler:
-            return handler(cs)
-        else:
-            raise InvalidPrefixError(f"Invalid prefix: {prefix_value}")
+        def store_data(index, data, error):
+            columns["data"][index] = data
+            if error is not None:
+                column("error")[index] = error
+
+        self._parse_batch(contents, max_workers, fetch, store, store_data)
+        return columns
+
+
+# SHA-256 keys of the standard labels, hashed once at import time
+_STANDARD_KEYS = TEP64Parser._batch_calculate_keys(_DEFAULT_VALUES)
 
 
 # Example custom handler for a new prefix
@@ -229,46 +661,44 @@ def custom_prefix_handler(cs, ipfs_endpoint):
     return {"type": "custom", "data": "custom handler logic"}
 
 
-# Register custom handlers
-custom_handlers = {
-    0x02: custom_prefix_handler,
-    # Add more custom handlers as needed
+# Sample content cells used by the demo, as serialized BOC hex strings
+_DEMO_HEX = {
+    # https://tonviewer.com/EQD0vdSA_NedR9uvbgN9EikRX-suesDxGeFg69XQMavfLqIw
+    "offchain_jetton_content": "b5ee9c7201010101004500008601697066733a2f2f6261666b7265696173743466716c6b7034757079753263766f37666e376161626a757378373635797a767169747372347270776676686a67756879",
+    # https://tonviewer.com/EQA4pCk0yK-JCwFD4Nl5ZE4pmlg4DkK-1Ou4HAUQ6RObZNMi
+    "onchain_jetton_content": "b5ee9c7201020c0100012f00010300c00102012002030143bff082eb663b57a00192f4a6ac467288df2dfeddb9da1bee28f6521c8bebd21f1ec0040201200506006e0068747470733a2f2f626974636f696e636173682d6578616d706c652e6769746875622e696f2f776562736974652f6c6f676f2e706e6702012007080142bf89046f7a37ad0ea7cee73355984fa5428982f8b37c8f7bcec91f7ac71a7cd1040b0141bf4546a6ffe1b79cfdd86bad3db874313dcde2fb05e6a74aa7f3552d9617c79d13090141bf6ed4f942a7848ce2cb066b77a1128c6a1ff8c43f438a2dce24612ba9ffab8b030a0016005061626c6f636f696e200008005062630078004c6f772066656520706565722d746f2d7065657220656c656374726f6e6963206361736820616c7465726e617469766520746f20426974636f696e",
+    # https://tonviewer.com/EQD7Qtnas8qpMvT7-Z634_6G60DGp02owte5NnEjaWq6hb7v
+    "offchain_collection_content": "b5ee9c7201010101002800004c0168747470733a2f2f6e66742e667261676d656e742e636f6d2f6e756d626572732e6a736f6e",
+    # https://tonviewer.com/EQD7Qtnas8qpMvT7-Z634_6G60DGp02owte5NnEjaWq6hb7v
+    "offchain_individual_content": "b5ee9c720101010100330000620168747470733a2f2f6e66742e667261676d656e742e636f6d2f6e756d6265722f38383830393639373530322e6a736f6e",
 }
 
-# Create an instance of the parser with custom handlers
-parser = TEP64Parser(
-    prefix_handlers=custom_handlers,
-)
-
-# Load the jetton content from BOC strings
-offchain_jetton_content = Cell.one_from_boc(
-    "b5ee9c7201010101004500008601697066733a2f2f6261666b7265696173743466716c6b7034757079753263766f37666e376161626a757378373635797a767169747372347270776676686a67756879"
-)  # https://tonviewer.com/EQD0vdSA_NedR9uvbgN9EikRX-suesDxGeFg69XQMavfLqIw
-onchain_jetton_content = Cell.one_from_boc(
-    "b5ee9c7201020c0100012f00010300c00102012002030143bff082eb663b57a00192f4a6ac467288df2dfeddb9da1bee28f6521c8bebd21f1ec0040201200506006e0068747470733a2f2f626974636f696e636173682d6578616d706c652e6769746875622e696f2f776562736974652f6c6f676f2e706e6702012007080142bf89046f7a37ad0ea7cee73355984fa5428982f8b37c8f7bcec91f7ac71a7cd1040b0141bf4546a6ffe1b79cfdd86bad3db874313dcde2fb05e6a74aa7f3552d9617c79d13090141bf6ed4f942a7848ce2cb066b77a1128c6a1ff8c43f438a2dce24612ba9ffab8b030a0016005061626c6f636f696e200008005062630078004c6f772066656520706565722d746f2d7065657220656c656374726f6e6963206361736820616c7465726e617469766520746f20426974636f696e"
-)  # https://tonviewer.com/EQA4pCk0yK-JCwFD4Nl5ZE4pmlg4DkK-1Ou4HAUQ6RObZNMi
-offchain_collection_content = Cell.one_from_boc(
-    "b5ee9c7201010101002800004c0168747470733a2f2f6e66742e667261676d656e742e636f6d2f6e756d626572732e6a736f6e"
-)  # https://tonviewer.com/EQD7Qtnas8qpMvT7-Z634_6G60DGp02owte5NnEjaWq6hb7v
-offchain_individual_content = Cell.one_from_boc(
-    "b5ee9c720101010100330000620168747470733a2f2f6e66742e667261676d656e742e636f6d2f6e756d6265722f38383830393639373530322e6a736f6e"
-)  # https://tonviewer.com/EQD7Qtnas8qpMvT7-Z634_6G60DGp02owte5NnEjaWq6hb7v
 
-try:
-    offchain_jetton_content_result = parser.parse_content(offchain_jetton_content)
-    print("offchain_jetton_content_result=", offchain_jetton_content_result)
+@lru_cache(maxsize=None)
+def _demo_cells():
+    """
+    Deserialize the demo BOCs once and reuse the resulting Cells.
 
-    onchain_jetton_content_result = parser.parse_content(onchain_jetton_content)
-    print("onchain_jetton_content_result=", onchain_jetton_content_result)
+    Returns:
+        dict: Mapping of demo content names to Cell objects.
+    """
+    return {name: Cell.one_from_boc(bytes.fromhex(h)) for name, h in _DEMO_HEX.items()}
 
-    offchain_collection_content_result = parser.parse_content(
-        offchain_collection_content
-    )
-    print("offchain_collection_content_result=", offchain_collection_content_result)
 
-    offchain_individual_content_result = parser.parse_content(
-        offchain_individual_content
+if __name__ == "__main__":
+    # Register custom handlers
+    custom_handlers = {
+        0x02: custom_prefix_handler,
+        # Add more custom handlers as needed
+    }
+
+    # Create an instance of the parser with custom handlers
+    parser = TEP64Parser(
+        prefix_handlers=custom_handlers,
     )
-    print("offchain_individual_content_result=", offchain_individual_content_result)
-except ContentParsingError as e:
-    print(f"Error during content parsing: {e}")
+
+    try:
+        for name, content in _demo_cells().items():
+            print(f"{name}_result=", parser.parse_content(content))
+    except ContentParsingError as e:
+        print(f"Error during content parsing: {e}")